@@ -3,12 +3,14 @@ import os
 
 def load_ctime_functions():
     if os.name == "nt":
-        import win32_setctime
 
         def get_ctime_windows(filepath):
             return os.stat(filepath).st_ctime
 
         def set_ctime_windows(filepath, timestamp):
+            # Imported lazily to avoid paying for it at startup if no file sink is ever added.
+            import win32_setctime
+
             if not win32_setctime.SUPPORTED:
                 return
 
@@ -1,30 +1,46 @@
 from os import environ
 
+_BOOL_TRUE = frozenset({"1", "true", "yes", "y", "ok", "on"})
+_BOOL_FALSE = frozenset({"0", "false", "no", "n", "nok", "off"})
+
+
+def _parse_str(key, val):
+    return val
+
+
+def _parse_bool(key, val):
+    lower_val = val.lower()
+    if lower_val in _BOOL_TRUE:
+        return True
+    if lower_val in _BOOL_FALSE:
+        return False
+    raise ValueError(f"Invalid environment variable '{key}' (expected a boolean): '{val}'")
+
+
+def _parse_int(key, val):
+    try:
+        return int(val)
+    except ValueError:
+        raise ValueError(
+            f"Invalid environment variable '{key}' (expected an integer): '{val}'"
+        ) from None
+
+
+_PARSERS = {str: _parse_str, bool: _parse_bool, int: _parse_int}
+
 
 def env(key, type_, default=None):
-    if key not in environ:
+    val = environ.get(key)
+
+    if val is None:
         return default
 
-    val = environ[key]
+    try:
+        parser = _PARSERS[type_]
+    except KeyError:
+        raise ValueError(f"The requested type '{type_!r}' is not supported") from None
 
-    if type_ == str:
-        return val
-    if type_ == bool:
-        if val.lower() in ["1", "true", "yes", "y", "ok", "on"]:
-            return True
-        if val.lower() in ["0", "false", "no", "n", "nok", "off"]:
-            return False
-        raise ValueError(
-            "Invalid environment variable '%s' (expected a boolean): '%s'" % (key, val)
-        )
-    if type_ == int:
-        try:
-            return int(val)
-        except ValueError:
-            raise ValueError(
-                "Invalid environment variable '%s' (expected an integer): '%s'" % (key, val)
-            ) from None
-    raise ValueError("The requested type '%r' is not supported" % type_)
+    return parser(key, val)
 
 
 LOGURU_AUTOINIT = env("LOGURU_AUTOINIT", bool, True)
@@ -3,6 +3,8 @@ import traceback
 
 
 class ErrorInterceptor:
+    __slots__ = ("_should_catch", "_handler_id")
+
     def __init__(self, should_catch, handler_id):
         self._should_catch = should_catch
         self._handler_id = handler_id
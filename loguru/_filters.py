@@ -1,24 +1,63 @@
+import functools
+
+
 def filter_none(record):
     return record["name"] is not None
 
 
-def filter_by_name(record, parent, length):
+def filter_by_name(record, parent):
     name = record["name"]
     if name is None:
         return False
-    return (name + ".")[:length] == parent
+    return (name + ".").startswith(parent)
 
 
-def filter_by_level(record, level_per_module):
-    name = record["name"]
+# Disabled modules are given a threshold that no level can reach, so that filtering boils down to a
+# single comparison.
+_DISABLED = float("inf")
+
+
+def filter_by_global_level(level, record):
+    return record["name"] is None or record["level"].no >= level
+
+
+def make_filter_by_level(level_per_module):
+    level_per_module = {
+        module: _DISABLED if level is False else level for module, level in level_per_module.items()
+    }
+    if level_per_module.keys() == {""}:
+        # A single threshold applies to every module, there is no need to walk the module ancestry.
+        return functools.partial(filter_by_global_level, level_per_module[""])
+    return FilterByLevel(level_per_module)
+
+
+class FilterByLevel:
+    def __init__(self, level_per_module):
+        self._level_per_module = level_per_module
+        self._cache = {}
+
+    def __call__(self, record):
+        name = record["name"]
+
+        try:
+            level = self._cache[name]
+        except KeyError:
+            level = self._cache[name] = self._resolve_level(name)
+
+        return record["level"].no >= level
+
+    def _resolve_level(self, name):
+        level_per_module = self._level_per_module
+
+        if name is None:
+            return level_per_module.get(None, 0)
+
+        parts = name.split(".")
+        ancestors = (".".join(parts[:i]) for i in range(len(parts), -1, -1))
+
+        for ancestor in ancestors:
+            level = level_per_module.get(ancestor, None)
+            if level is not None:
+                return level
 
-    while True:
-        level = level_per_module.get(name, None)
-        if level is False:
-            return False
-        if level is not None:
-            return record["level"].no >= level
-        if not name:
-            return True
-        index = name.rfind(".")
-        name = name[:index] if index != -1 else ""
+        return 0
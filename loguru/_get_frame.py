@@ -1,15 +1,18 @@
 import sys
-from sys import exc_info
 
 
 def get_frame_fallback(n):
+    # Without "sys._getframe()", "inspect.currentframe()" returns None, so raising an exception is
+    # the only portable way to reach the current frame.
     try:
         raise Exception
-    except Exception:
-        frame = exc_info()[2].tb_frame.f_back
-        for _ in range(n):
-            frame = frame.f_back
-        return frame
+    except Exception as e:
+        frame = e.__traceback__.tb_frame.f_back
+    for _ in range(n):
+        frame = frame.f_back
+        if frame is None:
+            raise ValueError("call stack is not deep enough")
+    return frame
 
 
 def load_get_frame_function():
@@ -874,8 +874,7 @@ class Logger:
             filter_func = _filters.filter_none
         elif isinstance(filter, str):
             parent = filter + "."
-            length = len(parent)
-            filter_func = functools.partial(_filters.filter_by_name, parent=parent, length=length)
+            filter_func = functools.partial(_filters.filter_by_name, parent=parent)
         elif isinstance(filter, dict):
             level_per_module = {}
             for module, level_ in filter.items():
@@ -910,9 +909,7 @@ class Logger:
                         "it should be a positive integer, not: '%d'" % (module, levelno_)
                     )
                 level_per_module[module] = levelno_
-            filter_func = functools.partial(
-                _filters.filter_by_level, level_per_module=level_per_module
-            )
+            filter_func = _filters.make_filter_by_level(level_per_module)
         elif callable(filter):
             if filter == builtins.filter:
                 raise ValueError(
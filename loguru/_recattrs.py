@@ -1,6 +1,20 @@
+import builtins
 import pickle
 from collections import namedtuple
 
+# Built-in exceptions which can be re-instantiated from any arguments. The syntax errors, the
+# Unicode errors and the exception groups are excluded because their constructors validate the
+# arguments they receive.
+_BUILTIN_EXCEPTION_TYPES = frozenset(
+    obj
+    for name, obj in vars(builtins).items()
+    if isinstance(obj, type)
+    and issubclass(obj, BaseException)
+    and not issubclass(obj, (SyntaxError, UnicodeError))
+    and not name.endswith("ExceptionGroup")
+)
+_PRIMITIVE_TYPES = frozenset({str, bytes, int, float, bool, type(None)})
+
 
 class RecordLevel:
     __slots__ = ("name", "no", "icon")
@@ -11,7 +25,7 @@ class RecordLevel:
         self.icon = icon
 
     def __repr__(self):
-        return "(name=%r, no=%r, icon=%r)" % (self.name, self.no, self.icon)
+        return f"(name={self.name!r}, no={self.no!r}, icon={self.icon!r})"
 
     def __format__(self, spec):
         return self.name.__format__(spec)
@@ -25,7 +39,7 @@ class RecordFile:
         self.path = path
 
     def __repr__(self):
-        return "(name=%r, path=%r)" % (self.name, self.path)
+        return f"(name={self.name!r}, path={self.path!r})"
 
     def __format__(self, spec):
         return self.name.__format__(spec)
@@ -39,7 +53,7 @@ class RecordThread:
         self.name = name
 
     def __repr__(self):
-        return "(id=%r, name=%r)" % (self.id, self.name)
+        return f"(id={self.id!r}, name={self.name!r})"
 
     def __format__(self, spec):
         return self.id.__format__(spec)
@@ -53,7 +67,7 @@ class RecordProcess:
         self.name = name
 
     def __repr__(self):
-        return "(id=%r, name=%r)" % (self.id, self.name)
+        return f"(id={self.id!r}, name={self.name!r})"
 
     def __format__(self, spec):
         return self.id.__format__(spec)
@@ -61,7 +75,7 @@ class RecordProcess:
 
 class RecordException(namedtuple("RecordException", ("type", "value", "traceback"))):
     def __repr__(self):
-        return "(type=%r, value=%r, traceback=%r)" % (self.type, self.value, self.traceback)
+        return f"(type={self.type!r}, value={self.value!r}, traceback={self.traceback!r})"
 
     def __reduce__(self):
         # The traceback is not picklable, therefore it needs to be removed. Additionally, there's a
@@ -71,6 +85,8 @@ class RecordException(namedtuple("RecordException", ("type", "value", "traceback
         # the pickled value later for optimization (so that it's not pickled twice). It's important
         # to note that custom exceptions might not necessarily raise a PickleError, hence the
         # generic Exception catch.
+        if self._is_safely_picklable(self.value):
+            return (RecordException, (self.type, self.value, None))
         try:
             pickled_value = pickle.dumps(self.value)
         except Exception:
@@ -78,6 +94,20 @@ class RecordException(namedtuple("RecordException", ("type", "value", "traceback
         else:
             return (RecordException._from_pickled_value, (self.type, pickled_value, None))
 
+    @staticmethod
+    def _is_safely_picklable(value):
+        # Built-in exceptions are pickled according to their "__reduce__()" method, which returns
+        # their arguments and possibly a state (e.g. "filename" of "OSError" or the "__dict__").
+        # If all of these are primitive values, pickling and unpickling are guaranteed to succeed,
+        # so there is no need to try serializing the exception beforehand.
+        if type(value) not in _BUILTIN_EXCEPTION_TYPES:
+            return False
+        reduced = value.__reduce__()
+        if not all(type(arg) in _PRIMITIVE_TYPES for arg in reduced[1]):
+            return False
+        state = reduced[2] if len(reduced) > 2 else None
+        return not state or all(type(val) in _PRIMITIVE_TYPES for val in state.values())
+
     @classmethod
     def _from_pickled_value(cls, type_, pickled_value, traceback_):
         try:
@@ -1,22 +1,37 @@
 import asyncio
 import logging
 import weakref
+from inspect import CO_COROUTINE
+from types import CodeType
 
 from ._asyncio_loop import get_running_loop, get_task_loop
 
 
 class StreamSink:
+    __slots__ = ("_stream", "_flushable", "_stoppable", "_completable")
+
     def __init__(self, stream):
         self._stream = stream
         self._flushable = callable(getattr(stream, "flush", None))
         self._stoppable = callable(getattr(stream, "stop", None))
-        self._completable = asyncio.iscoroutinefunction(getattr(stream, "complete", None))
+        self._completable = self._is_coroutine_function(getattr(stream, "complete", None))
 
     def write(self, message):
         self._stream.write(message)
         if self._flushable:
             self._stream.flush()
 
+    @staticmethod
+    def _is_coroutine_function(function):
+        # Functions and bound methods defined with "async def" are detected from their code flags,
+        # other objects (such as "functools.partial()") are left to "asyncio.iscoroutinefunction()".
+        if function is None:
+            return False
+        code = getattr(function, "__code__", None)
+        if isinstance(code, CodeType) and code.co_flags & CO_COROUTINE:
+            return True
+        return asyncio.iscoroutinefunction(function)
+
     def stop(self):
         if self._stoppable:
             self._stream.stop()
@@ -28,14 +43,18 @@ class StreamSink:
 
 
 class StandardSink:
+    __slots__ = ("_handler", "_handle", "_make_record")
+
     def __init__(self, handler):
         self._handler = handler
+        self._handle = handler.handle
+        self._make_record = logging.getLogger().makeRecord
 
     def write(self, message):
         record = message.record
         message = str(message)
         exc = record["exception"]
-        record = logging.getLogger().makeRecord(
+        record = self._make_record(
             record["name"],
             record["level"].no,
             record["file"].path,
@@ -48,7 +67,7 @@ class StandardSink:
         )
         if exc:
             record.exc_text = "\n"
-        self._handler.handle(record)
+        self._handle(record)
 
     def stop(self):
         self._handler.close()
@@ -56,8 +75,18 @@ class StandardSink:
     def tasks_to_complete(self):
         return []
 
+    def __getstate__(self):
+        return {"_handler": self._handler}
+
+    def __setstate__(self, state):
+        self._handler = state["_handler"]
+        self._handle = self._handler.handle
+        self._make_record = logging.getLogger().makeRecord
+
 
 class AsyncSink:
+    __slots__ = ("_function", "_loop", "_error_interceptor", "_tasks")
+
     def __init__(self, function, loop, error_interceptor):
         self._function = function
         self._loop = loop
@@ -93,28 +122,35 @@ class AsyncSink:
         # happens to be the handler lock). However, the tasks must not be awaited while the lock is
         # acquired as this could lead to a deadlock. Therefore, we first need to collect the tasks
         # to complete, then return them so that they can be awaited outside of the lock.
-        return [self._complete_task(task) for task in self._tasks]
+        tasks = [task for task in self._tasks if not task.done()]
+        if not tasks:
+            return []
+        return [self._complete_tasks(tasks)]
 
-    async def _complete_task(self, task):
+    async def _complete_tasks(self, tasks):
         loop = get_running_loop()
-        if get_task_loop(task) is not loop:
-            return
-        try:
-            await task
-        except Exception:
-            pass  # Handled in "check_exception()"
+        tasks = [task for task in tasks if get_task_loop(task) is loop]
+        if tasks:
+            # Exceptions are handled in "check_exception()".
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     def __getstate__(self):
-        state = self.__dict__.copy()
-        state["_tasks"] = None
-        return state
+        return {
+            "_function": self._function,
+            "_loop": self._loop,
+            "_error_interceptor": self._error_interceptor,
+        }
 
     def __setstate__(self, state):
-        self.__dict__.update(state)
+        self._function = state["_function"]
+        self._loop = state["_loop"]
+        self._error_interceptor = state["_error_interceptor"]
         self._tasks = weakref.WeakSet()
 
 
 class CallableSink:
+    __slots__ = ("_function",)
+
     def __init__(self, function):
         self._function = function
 
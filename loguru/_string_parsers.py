@@ -1,22 +1,68 @@
 import datetime
 import re
 
+_SIZE_RE = re.compile(r"([e\+\-\.\d]+)\s*([kmgtpezy])?(i)?(b)", flags=re.I)
+_SIZE_MULTIPLIERS = {
+    (unit, binary, bit): (1024 if binary else 1000) ** power / (8 if bit == "b" else 1)
+    for power, unit in enumerate([None, "k", "m", "g", "t", "p", "e", "z", "y"])
+    for binary in (False, True)
+    for bit in ("b", "B")
+}
+_DURATION_UNIT_RE = re.compile(r"(?:([e\+\-\.\d]+)\s*([a-z]+)[\s\,]*)", flags=re.I)
+_DURATION_FULL_RE = re.compile(_DURATION_UNIT_RE.pattern + "+", flags=re.I)
+_DURATION_UNITS_RE = re.compile(
+    r"(?P<y>y|years?)"
+    r"|(?P<mo>months?)"
+    r"|(?P<w>w|weeks?)"
+    r"|(?P<d>d|days?)"
+    r"|(?P<h>h|hours?)"
+    r"|(?P<min>min(?:ute)?s?)"
+    r"|(?P<s>s|sec(?:ond)?s?)"  # spellchecker: disable-line
+    r"|(?P<ms>ms|milliseconds?)"
+    r"|(?P<us>us|microseconds?)",
+    flags=re.I,
+)
+_DURATION_UNITS_SECONDS = {
+    "y": 31536000,
+    "mo": 2628000,
+    "w": 604800,
+    "d": 86400,
+    "h": 3600,
+    "min": 60,
+    "s": 1,
+    "ms": 0.001,
+    "us": 0.000001,
+}
+_TIME_RE = re.compile(r"^[\d\.\:]+\s*(?:[ap]m)?$", flags=re.I)
+_DAYTIME_RE = re.compile(r"^(.*?)\s+at\s+(.*)$", flags=re.I)
+_TIME_FORMATS = {
+    # (is_12h, number_of_colons, has_fraction): format
+    (False, 0, False): "%H",
+    (False, 1, False): "%H:%M",
+    (False, 2, False): "%H:%M:%S",
+    (False, 2, True): "%H:%M:%S.%f",
+    (True, 0, False): "%I %p",
+    (True, 1, False): "%I:%M %p",
+    (True, 2, False): "%I:%M:%S %p",
+    (True, 2, True): "%I:%M:%S.%f %p",
+}
+
 
 class Frequencies:
     @staticmethod
     def hourly(t):
         dt = t + datetime.timedelta(hours=1)
-        return dt.replace(minute=0, second=0, microsecond=0)
+        return datetime.datetime(dt.year, dt.month, dt.day, dt.hour, tzinfo=dt.tzinfo)
 
     @staticmethod
     def daily(t):
         dt = t + datetime.timedelta(days=1)
-        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        return datetime.datetime(dt.year, dt.month, dt.day, tzinfo=dt.tzinfo)
 
     @staticmethod
     def weekly(t):
         dt = t + datetime.timedelta(days=7 - t.weekday())
-        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        return datetime.datetime(dt.year, dt.month, dt.day, tzinfo=dt.tzinfo)
 
     @staticmethod
     def monthly(t):
@@ -24,19 +70,16 @@ class Frequencies:
             y, m = t.year + 1, 1
         else:
             y, m = t.year, t.month + 1
-        return t.replace(year=y, month=m, day=1, hour=0, minute=0, second=0, microsecond=0)
+        return datetime.datetime(y, m, 1, tzinfo=t.tzinfo)
 
     @staticmethod
     def yearly(t):
-        y = t.year + 1
-        return t.replace(year=y, month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+        return datetime.datetime(t.year + 1, 1, 1, tzinfo=t.tzinfo)
 
 
 def parse_size(size):
     size = size.strip()
-    reg = re.compile(r"([e\+\-\.\d]+)\s*([kmgtpezy])?(i)?(b)", flags=re.I)
-
-    match = reg.fullmatch(size)
+    match = _SIZE_RE.fullmatch(size)
 
     if not match:
         return None
@@ -48,45 +91,29 @@ def parse_size(size):
     except ValueError as e:
         raise ValueError("Invalid float value while parsing size: '%s'" % s) from e
 
-    u = "kmgtpezy".index(u.lower()) + 1 if u else 0
-    i = 1024 if i else 1000
-    b = {"b": 8, "B": 1}[b] if b else 1
-    return s * i**u / b
+    return s * _SIZE_MULTIPLIERS[u.lower() if u else None, i is not None, b]
 
 
 def parse_duration(duration):
     duration = duration.strip()
-    reg = r"(?:([e\+\-\.\d]+)\s*([a-z]+)[\s\,]*)"
-
-    units = [
-        ("y|years?", 31536000),
-        ("months?", 2628000),
-        ("w|weeks?", 604800),
-        ("d|days?", 86400),
-        ("h|hours?", 3600),
-        ("min(?:ute)?s?", 60),
-        ("s|sec(?:ond)?s?", 1),  # spellchecker: disable-line
-        ("ms|milliseconds?", 0.001),
-        ("us|microseconds?", 0.000001),
-    ]
-
-    if not re.fullmatch(reg + "+", duration, flags=re.I):
+
+    if not _DURATION_FULL_RE.fullmatch(duration):
         return None
 
     seconds = 0
 
-    for value, unit in re.findall(reg, duration, flags=re.I):
+    for value, unit in _DURATION_UNIT_RE.findall(duration):
         try:
             value = float(value)
         except ValueError as e:
             raise ValueError("Invalid float value while parsing duration: '%s'" % value) from e
 
-        try:
-            unit = next(u for r, u in units if re.fullmatch(r, unit, flags=re.I))
-        except StopIteration:
-            raise ValueError("Invalid unit value while parsing duration: '%s'" % unit) from None
+        match = _DURATION_UNITS_RE.fullmatch(unit)
 
-        seconds += value * unit
+        if not match:
+            raise ValueError("Invalid unit value while parsing duration: '%s'" % unit)
+
+        seconds += value * _DURATION_UNITS_SECONDS[match.lastgroup]
 
     return datetime.timedelta(seconds=seconds)
 
@@ -128,38 +155,25 @@ def parse_day(day):
 
 def parse_time(time):
     time = time.strip()
-    reg = re.compile(r"^[\d\.\:]+\s*(?:[ap]m)?$", flags=re.I)
 
-    if not reg.match(time):
+    if not _TIME_RE.match(time):
         return None
 
-    formats = [
-        "%H",
-        "%H:%M",
-        "%H:%M:%S",
-        "%H:%M:%S.%f",
-        "%I %p",
-        "%I:%M %S",
-        "%I:%M:%S %p",
-        "%I:%M:%S.%f %p",
-    ]
-
-    for format_ in formats:
+    is_12h = time[-2:].lower() in ("am", "pm")
+    format_ = _TIME_FORMATS.get((is_12h, time.count(":"), "." in time))
+
+    if format_ is not None:
         try:
-            dt = datetime.datetime.strptime(time, format_)
+            return datetime.datetime.strptime(time, format_).time()
         except ValueError:
             pass
-        else:
-            return dt.time()
 
     raise ValueError("Unrecognized format while parsing time: '%s'" % time)
 
 
 def parse_daytime(daytime):
     daytime = daytime.strip()
-    reg = re.compile(r"^(.*?)\s+at\s+(.*)$", flags=re.I)
-
-    match = reg.match(daytime)
+    match = _DAYTIME_RE.match(daytime)
     if match:
         day, time = match.groups()
     else:
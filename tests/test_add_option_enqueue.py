@@ -271,7 +271,48 @@ def test_logging_not_picklable_exception(exception_value):
     assert traceback_ is None
 
 
-@pytest.mark.parametrize("exception_value", [NotUnpicklable(), NotUnpicklableTypeError()])
+@pytest.mark.parametrize(
+    "exception",
+    [ValueError("Oups"), KeyError(42), OSError(2, "No such file", "foo.txt"), ImportError("x")],
+)
+def test_logging_builtin_exception(exception):
+    record_exception = None
+
+    def sink(message):
+        nonlocal record_exception
+        record_exception = message.record["exception"]
+
+    logger.add(sink, enqueue=True, catch=False)
+
+    try:
+        raise exception
+    except Exception:
+        logger.exception("Oups")
+
+    logger.remove()
+
+    type_, value, traceback_ = record_exception
+    assert type_ is type(exception)
+    assert type(value) is type(exception)
+    assert value.args == exception.args
+    assert str(value) == str(exception)
+    assert traceback_ is None
+
+
+def syntax_error_with_invalid_args():
+    error = SyntaxError("invalid syntax", ("file.py", 1, 1, "x x"))
+    error.args = ("invalid syntax", "file.py")
+    return error
+
+
+@pytest.mark.parametrize(
+    "exception_value",
+    [
+        ValueError(NotUnpicklable()),
+        ValueError(NotUnpicklableTypeError()),
+        syntax_error_with_invalid_args(),
+    ],
+)
 def test_logging_not_unpicklable_exception(exception_value):
     exception = None
 
@@ -282,13 +323,13 @@ def test_logging_not_unpicklable_exception(exception_value):
     logger.add(sink, enqueue=True, catch=False)
 
     try:
-        raise ValueError(exception_value)
+        raise exception_value
     except Exception:
         logger.exception("Oups")
 
     logger.remove()
 
     type_, value, traceback_ = exception
-    assert type_ is ValueError
+    assert type_ is type(exception_value)
     assert value is None
     assert traceback_ is None
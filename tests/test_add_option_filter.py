@@ -40,6 +40,7 @@ def test_filtered_in(filter, writer):
         (lambda r: False),
         (lambda r: r["level"].no != 10),
         {"": False},
+        {"": "INFO"},
         {"": True, "tests": 50},
         {"tests.test_add_option_filter": False},
         {"tests": "WARNING"},
@@ -61,6 +62,7 @@ def test_filtered_out(filter, writer):
         {},
         {None: 0},
         {"": False},
+        {"": "WARNING"},
         {"tests": False, None: True},
         {"unrelated": 100},
         {None: "INFO", "": "WARNING"},
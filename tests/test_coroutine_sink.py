@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 import multiprocessing
 import re
@@ -471,6 +472,34 @@ def test_custom_complete_function(capsys):
     assert awaited
 
 
+def test_custom_complete_function_partial(capsys):
+    awaited = False
+
+    async def complete(value):
+        nonlocal awaited
+        awaited = value
+
+    class Handler:
+        def __init__(self):
+            self.complete = functools.partial(complete, True)
+
+        def write(self, message):
+            print(message, end="")
+
+    async def worker():
+        logger.info("A")
+        await logger.complete()
+
+    logger.add(Handler(), catch=False, format="{message}")
+
+    asyncio.run(worker())
+
+    out, err = capsys.readouterr()
+    assert out == "A\n"
+    assert err == ""
+    assert awaited
+
+
 @pytest.mark.skipif(sys.version_info < (3, 5, 3), reason="Coroutine can't access running loop")
 @pytest.mark.parametrize("loop_is_none", [True, False])
 def test_complete_from_another_loop(capsys, loop_is_none):
@@ -115,6 +115,9 @@ def test_size_rotation(freeze_time, tmp_path, size):
         ("13:00:00", [0.5, 1.5, 10, 15, 72]),
         ("13:00:00.123456", [0.9, 2, 10, 15, 256]),
         ("11:00", [22.9, 0.2, 23, 1, 24]),
+        ("10:30 pm", [10, 1, 20, 4, 24]),
+        ("10:30:15 am", [22, 0.6, 23, 1, 24]),
+        ("1:00:00.5 PM", [0.5, 1.5, 10, 15, 72]),
         ("w0", [11, 1, 24 * 7 - 1, 1, 24 * 7]),
         ("W0 at 00:00", [10, 24 * 7 - 5, 0.1, 24 * 30, 24 * 14]),
         ("W6", [24, 24 * 28, 24 * 5, 24, 364 * 24]),
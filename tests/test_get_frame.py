@@ -1,5 +1,7 @@
 import sys
 
+import pytest
+
 import loguru
 from loguru._get_frame import load_get_frame_function
 
@@ -35,3 +37,8 @@ def test_get_frame_fallback():
     a()
 
     assert frame_a == frame_b == frame_root
+
+
+def test_get_frame_fallback_stack_not_deep_enough():
+    with pytest.raises(ValueError, match="call stack is not deep enough"):
+        loguru._get_frame.get_frame_fallback(10000)
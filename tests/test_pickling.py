@@ -248,6 +248,16 @@ def test_pickling_filter_name(capsys, filter):
     assert err == ""
 
 
+def test_pickling_filter_dict(capsys):
+    logger.add(print_, format="{message}", filter={"": False, "tests": "INFO"})
+    with copied_logger_though_pickle(logger) as dupe_logger:
+        dupe_logger.debug("Nope")
+        dupe_logger.info("Yes")
+    out, err = capsys.readouterr()
+    assert out == "Yes\n"
+    assert err == ""
+
+
 @pytest.mark.parametrize("colorize", [True, False])
 def test_pickling_format_string(capsys, colorize):
     logger.add(print_, format="-> <red>{message}</red>", colorize=colorize)